@@ -19,12 +19,12 @@ cursor.execute("""
         DATE(created_utc) as date,
         subreddit,
         title,
-        sentiment_compound,
+        sentiment_compound / 10000.0 as sentiment_compound,
         score,
         num_comments
     FROM social_posts_raw
     WHERE created_utc >= datetime('now', '-7 days')
-      AND sentiment_compound > 0.5
+      AND sentiment_compound > 5000
     ORDER BY sentiment_compound DESC, score DESC
     LIMIT 5
 """)
@@ -45,7 +45,7 @@ cursor.execute("""
         source,
         title,
         sentiment_label,
-        sentiment_confidence
+        sentiment_confidence / 10000.0 as sentiment_confidence
     FROM news_articles_raw
     WHERE published_at >= datetime('now', '-7 days')
     ORDER BY published_at DESC
@@ -82,7 +82,7 @@ cursor.execute("""
     SELECT 
         subreddit,
         COUNT(*) as total_posts,
-        AVG(sentiment_compound) as avg_sentiment,
+        AVG(sentiment_compound) / 10000.0 as avg_sentiment,
         SUM(CASE WHEN sentiment_label = 'POSITIVE' THEN 1 ELSE 0 END) as positive,
         SUM(CASE WHEN sentiment_label = 'NEGATIVE' THEN 1 ELSE 0 END) as negative,
         SUM(CASE WHEN sentiment_label = 'NEUTRAL' THEN 1 ELSE 0 END) as neutral
@@ -107,7 +107,7 @@ today = datetime.now().strftime('%Y-%m-%d')
 cursor.execute("""
     SELECT 
         COUNT(*) as posts,
-        AVG(sentiment_compound) as avg_sentiment
+        AVG(sentiment_compound) / 10000.0 as avg_sentiment
     FROM social_posts_raw
     WHERE DATE(created_utc) = ?
 """, (today,))
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from collections import Counter
 from src.connectors.base import BaseConnector
 from src.utils.sentiment_analyzer import (
-    analyze_finbert_sentiment,
+    analyze_finbert_sentiment_batch,
     aggregate_sentiment_scores,
     extract_keywords,
     classify_sentiment
@@ -77,19 +77,25 @@ class NewsConnector(BaseConnector):
             articles = response.get('articles', [])
             logger.info(f"Fetched {len(articles)} articles from NewsAPI")
             
-            # Process articles with sentiment analysis
-            processed = []
+            # Collect texts first so FinBERT runs in batches instead of
+            # one forward pass per article
+            scored_articles = []
+            texts = []
             for article in articles:
                 # Combine title and description for sentiment
                 text = f"{article.get('title', '')} {article.get('description', '')}"
-                
+
                 # Skip if no meaningful text
                 if not text.strip() or text.strip() == '[Removed]':
                     continue
-                
-                # Analyze sentiment using FinBERT
-                sentiment = analyze_finbert_sentiment(text)
-                
+
+                scored_articles.append(article)
+                texts.append(text)
+
+            sentiments = analyze_finbert_sentiment_batch(texts)
+
+            processed = []
+            for article, sentiment in zip(scored_articles, sentiments):
                 # Parse published date
                 published_at = article.get('publishedAt', '')
                 try:
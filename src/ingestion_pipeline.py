@@ -13,7 +13,7 @@ from src.connectors.news_connector import NewsConnector
 from src.connectors.trends_connector import TrendsConnector
 from src.storage.database import MarketDatabase
 from src.utils.csv_backup import CSVBackup
-from src.utils.config import Config
+from src.utils.config import CONFIG
 from src.utils.logger import setup_logger
 from src.utils.time_utils import get_date_string
 
@@ -28,33 +28,33 @@ class IngestionPipeline:
         logger.info("Initializing Ingestion Pipeline")
         
         # Validate configuration
-        Config.validate()
+        CONFIG.validate()
         
         # Initialize Phase 1 connectors
         self.coingecko = CoinGeckoConnector(
-            api_key=Config.COINGECKO_API_KEY,
-            rate_limit_delay=Config.RATE_LIMIT_DELAY
+            api_key=CONFIG.COINGECKO_API_KEY,
+            rate_limit_delay=CONFIG.RATE_LIMIT_DELAY
         )
         self.fear_greed = FearGreedConnector(
-            rate_limit_delay=Config.RATE_LIMIT_DELAY
+            rate_limit_delay=CONFIG.RATE_LIMIT_DELAY
         )
         self.etf_flows = ETFFlowsConnector(
-            api_key=Config.SOSOVALUE_API_KEY,
-            rate_limit_delay=Config.RATE_LIMIT_DELAY
+            api_key=CONFIG.SOSOVALUE_API_KEY,
+            rate_limit_delay=CONFIG.RATE_LIMIT_DELAY
         )
         
         # Initialize Phase 2 connectors
         self.market_metrics = None
         self.binance_futures = None
         
-        if Config.ENABLE_MARKET_METRICS:
+        if CONFIG.ENABLE_MARKET_METRICS:
             self.market_metrics = MarketMetricsConnector(
-                api_key=Config.COINGECKO_API_KEY,
-                rate_limit_delay=Config.RATE_LIMIT_DELAY
+                api_key=CONFIG.COINGECKO_API_KEY,
+                rate_limit_delay=CONFIG.RATE_LIMIT_DELAY
             )
             logger.info("Market metrics connector enabled")
         
-        if Config.ENABLE_DERIVATIVES_DATA:
+        if CONFIG.ENABLE_DERIVATIVES_DATA:
             self.binance_futures = BinanceFuturesConnector(
                 rate_limit_delay=0.5
             )
@@ -68,12 +68,12 @@ class IngestionPipeline:
         self.trends = None
         
         # Reddit: Try API first, fallback to RSS if API unavailable
-        if Config.ENABLE_SOCIAL_SENTIMENT and Config.REDDIT_CLIENT_ID:
+        if CONFIG.ENABLE_SOCIAL_SENTIMENT and CONFIG.REDDIT_CLIENT_ID:
             try:
                 self.reddit = RedditConnector(
-                    client_id=Config.REDDIT_CLIENT_ID,
-                    client_secret=Config.REDDIT_CLIENT_SECRET,
-                    user_agent=Config.REDDIT_USER_AGENT,
+                    client_id=CONFIG.REDDIT_CLIENT_ID,
+                    client_secret=CONFIG.REDDIT_CLIENT_SECRET,
+                    user_agent=CONFIG.REDDIT_USER_AGENT,
                     rate_limit_delay=2.0
                 )
                 logger.info("Reddit API connector enabled")
@@ -81,7 +81,7 @@ class IngestionPipeline:
                 logger.warning(f"Reddit API connector initialization failed: {e}")
         
         # Reddit RSS fallback (no API key required)
-        if Config.ENABLE_REDDIT_RSS or (Config.ENABLE_SOCIAL_SENTIMENT and not self.reddit):
+        if CONFIG.ENABLE_REDDIT_RSS or (CONFIG.ENABLE_SOCIAL_SENTIMENT and not self.reddit):
             try:
                 self.reddit_rss = RedditRSSConnector(rate_limit_delay=2.0)
                 logger.info("Reddit RSS connector enabled (no API key required)")
@@ -89,27 +89,27 @@ class IngestionPipeline:
                 logger.warning(f"Reddit RSS connector initialization failed: {e}")
         
         # Twitter connector
-        if Config.ENABLE_TWITTER_SENTIMENT and Config.TWITTER_BEARER_TOKEN:
+        if CONFIG.ENABLE_TWITTER_SENTIMENT and CONFIG.TWITTER_BEARER_TOKEN:
             try:
                 self.twitter = TwitterConnector(
-                    bearer_token=Config.TWITTER_BEARER_TOKEN,
+                    bearer_token=CONFIG.TWITTER_BEARER_TOKEN,
                     rate_limit_delay=1.0
                 )
                 logger.info("Twitter connector enabled")
             except Exception as e:
                 logger.warning(f"Twitter connector initialization failed: {e}")
         
-        if Config.ENABLE_NEWS_SENTIMENT and Config.NEWSAPI_KEY:
+        if CONFIG.ENABLE_NEWS_SENTIMENT and CONFIG.NEWSAPI_KEY:
             try:
                 self.news = NewsConnector(
-                    api_key=Config.NEWSAPI_KEY,
+                    api_key=CONFIG.NEWSAPI_KEY,
                     rate_limit_delay=1.0
                 )
                 logger.info("News connector enabled")
             except Exception as e:
                 logger.warning(f"News connector initialization failed: {e}")
         
-        if Config.ENABLE_SEARCH_TRENDS:
+        if CONFIG.ENABLE_SEARCH_TRENDS:
             try:
                 self.trends = TrendsConnector(
                     rate_limit_delay=2.0
@@ -119,12 +119,12 @@ class IngestionPipeline:
                 logger.warning(f"Trends connector initialization failed: {e}")
         
         # Initialize database
-        self.db = MarketDatabase(Config.DB_PATH)
+        self.db = MarketDatabase(CONFIG.DB_PATH)
         
         # Initialize CSV backup if enabled
         self.csv_backup = None
-        if Config.ENABLE_CSV_BACKUP:
-            self.csv_backup = CSVBackup(Config.CSV_BACKUP_PATH)
+        if CONFIG.ENABLE_CSV_BACKUP:
+            self.csv_backup = CSVBackup(CONFIG.CSV_BACKUP_PATH)
         
         logger.info("Pipeline initialization complete")
     
@@ -141,7 +141,7 @@ class IngestionPipeline:
         try:
             all_records = []
             
-            for asset in Config.TRACKED_ASSETS:
+            for asset in CONFIG.TRACKED_ASSETS:
                 logger.info(f"Fetching OHLC data for {asset}")
                 records = self.coingecko.fetch_ohlc_hourly(
                     coin_id=asset,
@@ -263,7 +263,7 @@ class IngestionPipeline:
         
         try:
             records = self.market_metrics.fetch_data(
-                coin_ids=Config.TRACKED_ASSETS
+                coin_ids=CONFIG.TRACKED_ASSETS
             )
             
             if records:
@@ -298,7 +298,7 @@ class IngestionPipeline:
         
         try:
             records = self.binance_futures.fetch_funding_rates_for_assets(
-                coin_ids=Config.TRACKED_ASSETS
+                coin_ids=CONFIG.TRACKED_ASSETS
             )
             
             if records:
@@ -333,7 +333,7 @@ class IngestionPipeline:
         
         try:
             records = self.binance_futures.fetch_open_interest_for_assets(
-                coin_ids=Config.TRACKED_ASSETS
+                coin_ids=CONFIG.TRACKED_ASSETS
             )
             
             if records:
@@ -627,7 +627,7 @@ class IngestionPipeline:
         
         results = {
             'timestamp': start_time.isoformat(),
-            'config': Config.display(),
+            'config': CONFIG.display(),
             'mode': 'BACKFILL' if etf_days > 30 else 'DAILY_SYNC',
             'ohlc': {},
             'sentiment': {},
@@ -733,7 +733,7 @@ class IngestionPipeline:
         """
         return {
             'record_counts': self.db.get_record_counts(),
-            'config': Config.display()
+            'config': CONFIG.display()
         }
 
 
@@ -1,6 +1,7 @@
 """Database operations for data ingestion and retrieval"""
 import sqlite3
-from typing import List, Dict, Any, Optional
+from collections import namedtuple
+from typing import Iterable, List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 from src.storage.schema import DatabaseSchema
@@ -8,29 +9,73 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Positional social-post payload matching social_posts_raw column order;
+# connectors that build rows in bulk can feed these straight to
+# insert_social_posts_raw_tuples without per-row dict key lookups
+SocialPostRaw = namedtuple('SocialPostRaw', [
+    'post_id', 'platform', 'subreddit', 'title', 'text', 'author',
+    'created_utc', 'score', 'upvote_ratio', 'num_comments', 'url',
+    'sentiment_compound', 'sentiment_pos', 'sentiment_neg',
+    'sentiment_neu', 'sentiment_label'
+])
+
 
 class MarketDatabase:
     """Handles all database operations with idempotent writes"""
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pragmas: Optional[List[str]] = None):
         """
         Initialize database connection
-        
+
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or a "file:" URI
+                     (e.g. a shared-cache in-memory database)
+            pragmas: Optional PRAGMA statements (without the keyword)
+                     applied to every connection, e.g. "synchronous=OFF"
+                     for ephemeral databases where durability is moot
         """
-        self.db_path = Path(db_path)
+        self.is_uri = str(db_path).startswith('file:')
+        self.db_path = str(db_path) if self.is_uri else Path(db_path)
+        self.pragmas = tuple(pragmas) if pragmas else ()
         self.schema = DatabaseSchema(db_path)
-        
-        # Initialize schema if needed
-        if not self.schema.verify_schema():
-            self.schema.initialize_database()
-    
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Initialize or upgrade the schema as needed: a missing table or
+        # a recorded version behind the code both re-run the idempotent
+        # DDL, so new tables and indexes reach existing databases too
+        if (not self.schema.verify_schema()
+                or (self.schema.get_current_version() or 0)
+                < DatabaseSchema.SCHEMA_VERSION):
+            self.schema.upgrade_database()
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection, opened lazily
+
+        Keeping one connection alive lets sqlite3's per-connection
+        statement cache actually work: the repeated INSERT/SELECT texts
+        used by the helpers are compiled once instead of re-parsed on a
+        fresh connection per call. The cache is sized to comfortably
+        hold every statement this class issues.
+        """
+        if self._conn is None:
+            # isolation_level=None disables the driver's implicit BEGIN
+            # before DML; the write helpers open their transactions
+            # explicitly with BEGIN IMMEDIATE instead
+            conn = sqlite3.connect(
+                self.db_path, uri=self.is_uri,
+                isolation_level=None, cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in self.pragmas:
+                conn.execute(f"PRAGMA {pragma}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared connection (reopened lazily if used again)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def insert_ohlc_data(self, records: List[Dict[str, Any]]) -> int:
         """
@@ -56,6 +101,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -105,6 +152,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (r['as_of_date'], r['fng_value'], r['classification'])
@@ -146,6 +195,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -287,6 +338,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute(sql, (as_of_date, as_of_date, as_of_date, 
                                     as_of_date, as_of_date, as_of_date,
                                     as_of_date, as_of_date, as_of_date))
@@ -341,6 +394,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -392,6 +447,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -441,6 +498,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -488,13 +547,21 @@ class MarketDatabase:
              created_utc, score, upvote_ratio, num_comments, url,
              sentiment_compound, sentiment_pos, sentiment_neg, 
              sentiment_neu, sentiment_label)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER), ?)
         """
         
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
+
+                # One immediate transaction for the whole batch: the write
+                # lock is taken once and all rows share a single commit
+                cursor.execute("BEGIN IMMEDIATE")
+
                 data = [
                     (
                         r['id'],
@@ -528,6 +595,50 @@ class MarketDatabase:
             logger.error(f"Failed to insert raw social posts: {e}")
             raise
     
+    def insert_social_posts_raw_tuples(self, rows: Iterable[tuple]) -> int:
+        """
+        Insert raw social posts from positional tuples (idempotent)
+
+        Fast path for bulk callers: rows already in social_posts_raw
+        column order (see SocialPostRaw) go straight to executemany,
+        skipping the per-row dict key lookups of insert_social_posts_raw.
+
+        Args:
+            rows: Iterable of SocialPostRaw tuples (or plain tuples in
+                  the same column order)
+
+        Returns:
+            Number of records inserted/updated
+        """
+        sql = """
+            INSERT OR REPLACE INTO social_posts_raw
+            (post_id, platform, subreddit, title, text, author,
+             created_utc, score, upvote_ratio, num_comments, url,
+             sentiment_compound, sentiment_pos, sentiment_neg,
+             sentiment_neu, sentiment_label)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER), ?)
+        """
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(sql, rows)
+                conn.commit()
+
+                count = cursor.rowcount
+                logger.info(f"Inserted/updated {count} raw social post records")
+                return count
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to insert raw social posts: {e}")
+            raise
+
     def insert_social_sentiment(self, records: List[Dict[str, Any]]) -> int:
         """
         Insert social sentiment data (idempotent)
@@ -556,6 +667,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -606,13 +719,22 @@ class MarketDatabase:
             (article_url, title, description, source, author, published_at,
              sentiment_compound, sentiment_label, sentiment_confidence,
              positive_prob, negative_prob, neutral_prob)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?,
+                    CAST(ROUND(? * 10000) AS INTEGER), ?,
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER),
+                    CAST(ROUND(? * 10000) AS INTEGER))
         """
         
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
+
+                # One immediate transaction for the whole batch: the write
+                # lock is taken once and all rows share a single commit
+                cursor.execute("BEGIN IMMEDIATE")
+
                 data = [
                     (
                         r['url'],
@@ -669,6 +791,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -714,13 +838,17 @@ class MarketDatabase:
         sql = """
             INSERT OR REPLACE INTO search_trends_raw 
             (ts_utc, keyword, interest_score, geo, timeframe)
-            VALUES (?, ?, ?, ?, ?)
+            VALUES (?, ?, CAST(ROUND(?) AS INTEGER), ?, ?)
         """
         
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
+
+                # One immediate transaction for the whole batch: the write
+                # lock is taken once and all rows share a single commit
+                cursor.execute("BEGIN IMMEDIATE")
+
                 data = [
                     (
                         r['ts_utc'],
@@ -769,6 +897,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 data = [
                     (
@@ -815,7 +945,7 @@ class MarketDatabase:
                     DATE(created_utc) as post_date,
                     platform,
                     COUNT(*) as mentions_count,
-                    AVG(sentiment_compound) as sentiment_score,
+                    AVG(sentiment_compound) / 10000.0 as sentiment_score,
                     SUM(CASE WHEN sentiment_label = 'POSITIVE' THEN 1 ELSE 0 END) as positive_mentions,
                     SUM(CASE WHEN sentiment_label = 'NEGATIVE' THEN 1 ELSE 0 END) as negative_mentions,
                     SUM(CASE WHEN sentiment_label = 'NEUTRAL' THEN 1 ELSE 0 END) as neutral_mentions,
@@ -846,6 +976,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute(sql, (as_of_date, as_of_date))
                 conn.commit()
                 logger.info(f"Social sentiment computed from raw data for {as_of_date}")
@@ -872,10 +1004,12 @@ class MarketDatabase:
                 SELECT 
                     DATE(published_at) as pub_date,
                     COUNT(*) as article_count,
-                    AVG(sentiment_compound) as avg_sentiment,
-                    (SUM(CASE WHEN sentiment_label = 'positive' THEN 1 ELSE 0 END) * 100.0 / COUNT(*)) as positive_pct,
-                    (SUM(CASE WHEN sentiment_label = 'negative' THEN 1 ELSE 0 END) * 100.0 / COUNT(*)) as negative_pct,
-                    (SUM(CASE WHEN sentiment_label = 'neutral' THEN 1 ELSE 0 END) * 100.0 / COUNT(*)) as neutral_pct
+                    AVG(sentiment_compound) / 10000.0 as avg_sentiment,
+                    -- AVG over 100/0 folds the SUM(CASE)/COUNT(*) division
+                    -- into a single conditional aggregate per label
+                    AVG(CASE sentiment_label WHEN 'positive' THEN 100.0 ELSE 0 END) as positive_pct,
+                    AVG(CASE sentiment_label WHEN 'negative' THEN 100.0 ELSE 0 END) as negative_pct,
+                    AVG(CASE sentiment_label WHEN 'neutral' THEN 100.0 ELSE 0 END) as neutral_pct
                 FROM news_articles_raw
                 WHERE DATE(published_at) = ?
                 GROUP BY DATE(published_at)
@@ -897,6 +1031,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute(sql, (as_of_date, as_of_date))
                 conn.commit()
                 logger.info(f"News sentiment computed from raw data for {as_of_date}")
@@ -905,6 +1041,66 @@ class MarketDatabase:
             logger.error(f"Failed to compute news sentiment from raw: {e}")
             raise
     
+    def compute_news_sentiment_range(self, start_date: str, end_date: str) -> None:
+        """
+        Compute and store daily news sentiment for a date range (backfill)
+
+        Materializes the per-day stats into a TEMP table with one sequential
+        pass over news_articles_raw, then drives the INSERT OR REPLACE from
+        it — far cheaper than re-running the single-day aggregation per date.
+
+        Args:
+            start_date: First date in YYYY-MM-DD format (inclusive)
+            end_date: Last date in YYYY-MM-DD format (inclusive)
+        """
+        logger.info(f"Computing news sentiment for range {start_date}..{end_date}")
+
+        stats_sql = """
+            CREATE TEMP TABLE news_stats_by_day AS
+            SELECT
+                DATE(published_at) as pub_date,
+                COUNT(*) as article_count,
+                AVG(sentiment_compound) / 10000.0 as avg_sentiment,
+                AVG(CASE sentiment_label WHEN 'positive' THEN 100.0 ELSE 0 END) as positive_pct,
+                AVG(CASE sentiment_label WHEN 'negative' THEN 100.0 ELSE 0 END) as negative_pct,
+                AVG(CASE sentiment_label WHEN 'neutral' THEN 100.0 ELSE 0 END) as neutral_pct
+            FROM news_articles_raw
+            WHERE DATE(published_at) BETWEEN ? AND ?
+            GROUP BY DATE(published_at)
+        """
+
+        insert_sql = """
+            INSERT OR REPLACE INTO news_sentiment_daily
+            (as_of_date, article_count, avg_sentiment, positive_pct,
+             negative_pct, neutral_pct, top_sources, top_keywords, source)
+            SELECT
+                pub_date,
+                article_count,
+                avg_sentiment,
+                positive_pct,
+                negative_pct,
+                neutral_pct,
+                '' as top_sources,
+                '' as top_keywords,
+                'NEWSAPI' as source
+            FROM news_stats_by_day
+        """
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(stats_sql, (start_date, end_date))
+                cursor.execute(insert_sql)
+                cursor.execute("DROP TABLE news_stats_by_day")
+                conn.commit()
+                logger.info(f"News sentiment computed for range {start_date}..{end_date}")
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to compute news sentiment range: {e}")
+            raise
+
     def compute_search_interest_from_raw(self, as_of_date: str) -> None:
         """
         Compute and store daily search interest from raw trends
@@ -957,6 +1153,8 @@ class MarketDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute(sql, (as_of_date, as_of_date, as_of_date))
                 conn.commit()
                 logger.info(f"Search interest computed from raw data for {as_of_date}")
@@ -965,6 +1163,63 @@ class MarketDatabase:
             logger.error(f"Failed to compute search interest from raw: {e}")
             raise
     
+    def scalar(self, sql: str, params: tuple = ()) -> Any:
+        """
+        Run a query and return the first column of its first row
+
+        Args:
+            sql: SELECT statement
+            params: Bound parameters
+
+        Returns:
+            The single value, or None if the query matched no rows
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(sql, params).fetchone()
+                return row[0] if row is not None else None
+
+        except sqlite3.Error as e:
+            logger.error(f"Scalar query failed: {e}")
+            raise
+
+    def scalar_row(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """
+        Run a query and return its first row as a plain tuple
+
+        Args:
+            sql: SELECT statement
+            params: Bound parameters
+
+        Returns:
+            The first row as a tuple, or None if the query matched no rows
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(sql, params).fetchone()
+                return tuple(row) if row is not None else None
+
+        except sqlite3.Error as e:
+            logger.error(f"Row query failed: {e}")
+            raise
+
+    def count(self, table: str, where: Optional[str] = None, params: tuple = ()) -> int:
+        """
+        Count rows in a table, optionally filtered
+
+        Args:
+            table: Table name (caller-controlled, not user input)
+            where: Optional WHERE clause without the keyword
+            params: Bound parameters for the WHERE clause
+
+        Returns:
+            Number of matching rows
+        """
+        sql = f"SELECT COUNT(*) FROM {table}"
+        if where:
+            sql += f" WHERE {where}"
+        return self.scalar(sql, params)
+
     def get_record_counts(self) -> Dict[str, int]:
         """Get record counts for all tables"""
         tables = ['ohlc_hourly', 'sentiment_daily', 'etf_flows_daily', 
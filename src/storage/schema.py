@@ -1,23 +1,47 @@
 """Database schema definitions for SQLite"""
+import functools
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
 
+@functools.lru_cache(maxsize=4)
+def _existing_tables(db_path: str, mtime_ns: int) -> FrozenSet[str]:
+    """Table names in the database, cached per (path, mtime) snapshot
+
+    The mtime key makes any DB mutation a cache miss, so repeated startup
+    checks within one process cost a single SQLite round-trip.
+    """
+    with sqlite3.connect(db_path, uri=db_path.startswith('file:')) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        return frozenset(row[0] for row in cursor.fetchall())
+
+
+@functools.lru_cache(maxsize=4)
+def _schema_version(db_path: str, mtime_ns: int) -> Optional[int]:
+    """Max recorded schema version, cached per (path, mtime) snapshot"""
+    with sqlite3.connect(db_path, uri=db_path.startswith('file:')) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        result = cursor.fetchone()
+        return result[0] if result else None
+
+
 class DatabaseSchema:
     """Manages database schema creation and migrations"""
     
     # Schema version for future migrations
-    SCHEMA_VERSION = 4  # Updated for Phase 3 - Raw data storage
+    SCHEMA_VERSION = 6  # Fixed-point sentiment columns in raw tables
     
     # Table creation SQL statements
     TABLES = {
         'ohlc_hourly': """
             CREATE TABLE IF NOT EXISTS ohlc_hourly (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 asset TEXT NOT NULL,
                 ts_utc TIMESTAMP NOT NULL,
                 open REAL NOT NULL,
@@ -32,7 +56,7 @@ class DatabaseSchema:
         
         'sentiment_daily': """
             CREATE TABLE IF NOT EXISTS sentiment_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL UNIQUE,
                 fng_value INTEGER NOT NULL,
                 classification TEXT NOT NULL,
@@ -42,7 +66,7 @@ class DatabaseSchema:
         
         'etf_flows_daily': """
             CREATE TABLE IF NOT EXISTS etf_flows_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 ticker TEXT NOT NULL,
                 net_flow_usd REAL,
@@ -55,7 +79,7 @@ class DatabaseSchema:
         
         'market_metrics_daily': """
             CREATE TABLE IF NOT EXISTS market_metrics_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 asset TEXT NOT NULL,
                 volume_24h_usd REAL,
@@ -70,7 +94,7 @@ class DatabaseSchema:
         
         'funding_rates_snapshots': """
             CREATE TABLE IF NOT EXISTS funding_rates_snapshots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 ts_utc TIMESTAMP NOT NULL,
                 asset TEXT NOT NULL,
                 funding_rate_pct REAL NOT NULL,
@@ -84,7 +108,7 @@ class DatabaseSchema:
         
         'open_interest_daily': """
             CREATE TABLE IF NOT EXISTS open_interest_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 asset TEXT NOT NULL,
                 open_interest_usd REAL NOT NULL,
@@ -97,7 +121,7 @@ class DatabaseSchema:
         
         'daily_market_snapshot': """
             CREATE TABLE IF NOT EXISTS daily_market_snapshot (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 asset TEXT NOT NULL,
                 price_close_usd REAL,
@@ -117,9 +141,12 @@ class DatabaseSchema:
             )
         """,
         
+        # Sentiment scores/probabilities in the raw tables are stored as
+        # fixed-point integers (value * 10000): 2 bytes instead of an
+        # 8-byte REAL per column, roughly halving row and index size
         'social_posts_raw': """
             CREATE TABLE IF NOT EXISTS social_posts_raw (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 post_id TEXT NOT NULL,
                 platform TEXT NOT NULL,
                 subreddit TEXT,
@@ -131,10 +158,10 @@ class DatabaseSchema:
                 upvote_ratio REAL,
                 num_comments INTEGER,
                 url TEXT,
-                sentiment_compound REAL,
-                sentiment_pos REAL,
-                sentiment_neg REAL,
-                sentiment_neu REAL,
+                sentiment_compound INTEGER,
+                sentiment_pos INTEGER,
+                sentiment_neg INTEGER,
+                sentiment_neu INTEGER,
                 sentiment_label TEXT,
                 ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 UNIQUE(post_id, platform)
@@ -143,7 +170,7 @@ class DatabaseSchema:
         
         'social_sentiment_daily': """
             CREATE TABLE IF NOT EXISTS social_sentiment_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 platform TEXT NOT NULL,
                 mentions_count INTEGER DEFAULT 0,
@@ -161,26 +188,26 @@ class DatabaseSchema:
         
         'news_articles_raw': """
             CREATE TABLE IF NOT EXISTS news_articles_raw (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 article_url TEXT NOT NULL UNIQUE,
                 title TEXT,
                 description TEXT,
                 source TEXT,
                 author TEXT,
                 published_at TIMESTAMP NOT NULL,
-                sentiment_compound REAL,
+                sentiment_compound INTEGER,
                 sentiment_label TEXT,
-                sentiment_confidence REAL,
-                positive_prob REAL,
-                negative_prob REAL,
-                neutral_prob REAL,
+                sentiment_confidence INTEGER,
+                positive_prob INTEGER,
+                negative_prob INTEGER,
+                neutral_prob INTEGER,
                 ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """,
         
         'news_sentiment_daily': """
             CREATE TABLE IF NOT EXISTS news_sentiment_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 article_count INTEGER DEFAULT 0,
                 avg_sentiment REAL,
@@ -197,10 +224,10 @@ class DatabaseSchema:
         
         'search_trends_raw': """
             CREATE TABLE IF NOT EXISTS search_trends_raw (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 ts_utc TIMESTAMP NOT NULL,
                 keyword TEXT NOT NULL,
-                interest_score REAL NOT NULL,
+                interest_score INTEGER NOT NULL,
                 geo TEXT DEFAULT '',
                 timeframe TEXT,
                 ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -210,7 +237,7 @@ class DatabaseSchema:
         
         'search_interest_daily': """
             CREATE TABLE IF NOT EXISTS search_interest_daily (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 as_of_date DATE NOT NULL,
                 keyword TEXT NOT NULL,
                 interest_score REAL NOT NULL,
@@ -257,6 +284,12 @@ class DatabaseSchema:
         "CREATE INDEX IF NOT EXISTS idx_news_raw_published ON news_articles_raw(published_at)",
         "CREATE INDEX IF NOT EXISTS idx_search_raw_ts ON search_trends_raw(ts_utc)",
         "CREATE INDEX IF NOT EXISTS idx_search_raw_keyword ON search_trends_raw(keyword)",
+
+        # Expression indexes matching the DATE(...) predicates used by the
+        # compute_*_from_raw aggregations, so those queries search instead of scan
+        "CREATE INDEX IF NOT EXISTS idx_news_raw_pubdate ON news_articles_raw(DATE(published_at))",
+        "CREATE INDEX IF NOT EXISTS idx_social_raw_created_date ON social_posts_raw(DATE(created_utc))",
+        "CREATE INDEX IF NOT EXISTS idx_search_raw_ts_date ON search_trends_raw(DATE(ts_utc), keyword)",
         
         # Phase 3 indexes - aggregated tables
         "CREATE INDEX IF NOT EXISTS idx_social_date ON social_sentiment_daily(as_of_date)",
@@ -266,78 +299,189 @@ class DatabaseSchema:
         "CREATE INDEX IF NOT EXISTS idx_search_keyword ON search_interest_daily(keyword)",
     ]
     
+    # Raw-table columns converted to fixed-point integers in version 6;
+    # pre-v6 databases hold plain floats here and must be rescaled on
+    # upgrade or every de-scaling reader would see them 10,000x too small
+    _FIXED_POINT_COLUMNS = {
+        'social_posts_raw': (
+            'sentiment_compound', 'sentiment_pos',
+            'sentiment_neg', 'sentiment_neu',
+        ),
+        'news_articles_raw': (
+            'sentiment_compound', 'sentiment_confidence',
+            'positive_prob', 'negative_prob', 'neutral_prob',
+        ),
+    }
+
     def __init__(self, db_path: str):
         """
         Initialize schema manager
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or a "file:" URI
+                     (e.g. a shared-cache in-memory database)
         """
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.is_uri = str(db_path).startswith('file:')
+        if self.is_uri:
+            self.db_path = str(db_path)
+        else:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    def initialize_database(self) -> None:
-        """Create all tables and indexes if they don't exist"""
+    def initialize_database(self, create_indexes: bool = True) -> None:
+        """
+        Create all tables (and optionally indexes) if they don't exist
+
+        Args:
+            create_indexes: Skip index creation when False so bulk backfills
+                            can load data first and call create_indexes() once
+        """
         logger.info(f"Initializing database at {self.db_path}")
-        
+
+        self.create_tables()
+        if create_indexes:
+            self.create_indexes()
+
+        logger.info("Database initialization complete")
+
+    def upgrade_database(self) -> None:
+        """
+        Bring a database recorded at an older version up to SCHEMA_VERSION
+
+        All DDL is IF NOT EXISTS, so re-running initialize_database() on
+        an existing database idempotently adds any tables and indexes
+        introduced since the recorded version, then records the current
+        one. Databases already at SCHEMA_VERSION are left untouched.
+        """
+        version = self.get_current_version() or 0
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        if version:
+            logger.info(
+                f"Upgrading schema from version {version} "
+                f"to {self.SCHEMA_VERSION}"
+            )
+
+        if version < 6:
+            self._rescale_raw_sentiment()
+
+        self.initialize_database()
+
+    def _rescale_raw_sentiment(self) -> None:
+        """
+        Convert pre-v6 REAL sentiment values to fixed-point integers
+
+        Version 6 stores raw-table sentiment scores as value * 10000
+        INTEGERs and every reader de-scales to match. The stored values
+        are rescaled with an in-place UPDATE — no table rebuild, so
+        columns declared REAL by older DDL keep float values, just at
+        the scale the readers expect. Version 6 is recorded in the same
+        transaction so an interrupted upgrade cannot rescale twice.
+        """
+        try:
+            existing = _existing_tables(str(self.db_path), self._db_mtime_ns())
+
+            with sqlite3.connect(self.db_path, uri=self.is_uri) as conn:
+                cursor = conn.cursor()
+
+                for table, columns in self._FIXED_POINT_COLUMNS.items():
+                    if table not in existing:
+                        continue
+                    assignments = ', '.join(
+                        f"{col} = CAST(ROUND({col} * 10000) AS INTEGER)"
+                        for col in columns
+                    )
+                    logger.info(f"Rescaling sentiment columns in {table}")
+                    cursor.execute(f"UPDATE {table} SET {assignments}")
+
+                if 'schema_version' in existing:
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO schema_version (version) VALUES (6)"
+                    )
+
+                conn.commit()
+
+        except sqlite3.Error as e:
+            logger.error(f"Fixed-point sentiment migration failed: {e}")
+            raise
+
+    def create_tables(self) -> None:
+        """Create all tables in a single transaction"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with sqlite3.connect(self.db_path, uri=self.is_uri) as conn:
                 cursor = conn.cursor()
-                
-                # Create tables
+
                 for table_name, create_sql in self.TABLES.items():
                     logger.debug(f"Creating table: {table_name}")
                     cursor.execute(create_sql)
-                
-                # Create indexes
-                for index_sql in self.INDEXES:
-                    logger.debug(f"Creating index")
-                    cursor.execute(index_sql)
-                
+
                 # Record schema version
                 cursor.execute(
                     "INSERT OR IGNORE INTO schema_version (version) VALUES (?)",
                     (self.SCHEMA_VERSION,)
                 )
-                
+
                 conn.commit()
-                logger.info("Database initialization complete")
-                
+
         except sqlite3.Error as e:
-            logger.error(f"Database initialization failed: {e}")
+            logger.error(f"Table creation failed: {e}")
+            raise
+
+    def create_indexes(self) -> None:
+        """
+        Create all indexes in a single transaction
+
+        Building indexes after a bulk load sorts each B-tree in one pass,
+        which is far cheaper than maintaining the index on every INSERT.
+        """
+        try:
+            with sqlite3.connect(self.db_path, uri=self.is_uri) as conn:
+                cursor = conn.cursor()
+
+                for index_sql in self.INDEXES:
+                    logger.debug(f"Creating index")
+                    cursor.execute(index_sql)
+
+                conn.commit()
+
+        except sqlite3.Error as e:
+            logger.error(f"Index creation failed: {e}")
             raise
     
+    def _db_mtime_ns(self) -> int:
+        """Current DB file mtime in ns (0 for URIs or missing files)"""
+        if self.is_uri:
+            return 0
+        try:
+            return self.db_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
     def get_current_version(self) -> Optional[int]:
         """Get current schema version"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT MAX(version) FROM schema_version")
-                result = cursor.fetchone()
-                return result[0] if result else None
+            return _schema_version(str(self.db_path), self._db_mtime_ns())
         except sqlite3.Error:
             return None
-    
+
     def verify_schema(self) -> bool:
         """Verify all required tables exist"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table'"
-                )
-                existing_tables = {row[0] for row in cursor.fetchall()}
-                
-                required_tables = set(self.TABLES.keys())
-                missing_tables = required_tables - existing_tables
-                
-                if missing_tables:
-                    logger.warning(f"Missing tables: {missing_tables}")
-                    return False
-                
-                logger.info("Schema verification passed")
-                return True
-                
+            existing_tables = _existing_tables(
+                str(self.db_path), self._db_mtime_ns()
+            )
+
+            required_tables = set(self.TABLES.keys())
+            missing_tables = required_tables - existing_tables
+
+            if missing_tables:
+                logger.warning(f"Missing tables: {missing_tables}")
+                return False
+
+            logger.info("Schema verification passed")
+            return True
+
         except sqlite3.Error as e:
             logger.error(f"Schema verification failed: {e}")
             return False
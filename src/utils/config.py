@@ -1,109 +1,185 @@
-"""Configuration management using environment variables"""
+"""Configuration management using environment variables
+
+This module is the single source of truth for configuration: env vars are
+read exactly once at import into the frozen CONFIG singleton below, so
+worker processes and repeated imports never re-parse .env or re-hit
+os.environ.
+"""
+import functools
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
-# Load .env file if it exists
 env_path = Path(__file__).parent.parent.parent / '.env'
-if env_path.exists():
-    load_dotenv(env_path)
 
 
-class Config:
-    """Application configuration from environment variables"""
-    
+@functools.cache
+def _load_env() -> bool:
+    """Load the .env file at most once per process
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    if env_path.exists():
+        load_dotenv(env_path)
+        return True
+    return False
+
+
+_load_env()
+
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Application configuration from environment variables
+
+    Frozen with slots so hot-path reads (e.g. RATE_LIMIT_DELAY inside
+    ingestion loops) are C-level slot loads instead of class-dict lookups.
+    """
+
     # Database
-    DB_PATH = os.getenv('DB_PATH', 'data/market_intel.db')
-    
+    DB_PATH: str = os.getenv('DB_PATH', 'data/market_intel.db')
+
     # API Configuration
-    COINGECKO_API_KEY = os.getenv('COINGECKO_API_KEY', None)
-    SOSOVALUE_API_KEY = os.getenv('SOSOVALUE_API_KEY', None)
-    RATE_LIMIT_DELAY = float(os.getenv('RATE_LIMIT_DELAY', '1.5'))
-    
+    COINGECKO_API_KEY: Optional[str] = os.getenv('COINGECKO_API_KEY', None)
+    SOSOVALUE_API_KEY: Optional[str] = os.getenv('SOSOVALUE_API_KEY', None)
+    RATE_LIMIT_DELAY: float = float(os.getenv('RATE_LIMIT_DELAY', '1.5'))
+
     # Binance Futures API (Phase 2)
-    BINANCE_FUTURES_BASE_URL = os.getenv('BINANCE_FUTURES_BASE_URL', 'https://fapi.binance.com')
-    BINANCE_RATE_LIMIT_WEIGHT = int(os.getenv('BINANCE_RATE_LIMIT_WEIGHT', '1200'))
-    
+    BINANCE_FUTURES_BASE_URL: str = os.getenv('BINANCE_FUTURES_BASE_URL', 'https://fapi.binance.com')
+    BINANCE_RATE_LIMIT_WEIGHT: int = int(os.getenv('BINANCE_RATE_LIMIT_WEIGHT', '1200'))
+
     # Symbol mappings for Binance Futures
-    BINANCE_SYMBOLS = {
+    BINANCE_SYMBOLS: Dict[str, str] = field(default_factory=lambda: {
         'bitcoin': 'BTCUSDT',
         'ethereum': 'ETHUSDT'
-    }
-    
+    })
+
     # Data Retention
-    DATA_RETENTION_DAYS = int(os.getenv('DATA_RETENTION_DAYS', '365'))
-    
+    DATA_RETENTION_DAYS: int = int(os.getenv('DATA_RETENTION_DAYS', '365'))
+
     # Logging
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_PATH = os.getenv('LOG_PATH', 'logs/ingestion.log')
-    
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_PATH: str = os.getenv('LOG_PATH', 'logs/ingestion.log')
+
     # CSV Backup
-    ENABLE_CSV_BACKUP = os.getenv('ENABLE_CSV_BACKUP', 'true').lower() == 'true'
-    CSV_BACKUP_PATH = os.getenv('CSV_BACKUP_PATH', 'data/backups')
-    
+    ENABLE_CSV_BACKUP: bool = os.getenv('ENABLE_CSV_BACKUP', 'true').lower() == 'true'
+    CSV_BACKUP_PATH: str = os.getenv('CSV_BACKUP_PATH', 'data/backups')
+
     # Timezone
-    DEFAULT_TIMEZONE = os.getenv('DEFAULT_TIMEZONE', 'UTC')
-    
+    DEFAULT_TIMEZONE: str = os.getenv('DEFAULT_TIMEZONE', 'UTC')
+
     # Assets to track
-    TRACKED_ASSETS = ['bitcoin', 'ethereum']
-    
+    TRACKED_ASSETS: List[str] = field(default_factory=lambda: ['bitcoin', 'ethereum'])
+
     # Phase 2 Feature Flags
-    ENABLE_MARKET_METRICS = os.getenv('ENABLE_MARKET_METRICS', 'true').lower() == 'true'
-    ENABLE_DERIVATIVES_DATA = os.getenv('ENABLE_DERIVATIVES_DATA', 'true').lower() == 'true'
-    
+    ENABLE_MARKET_METRICS: bool = os.getenv('ENABLE_MARKET_METRICS', 'true').lower() == 'true'
+    ENABLE_DERIVATIVES_DATA: bool = os.getenv('ENABLE_DERIVATIVES_DATA', 'true').lower() == 'true'
+
     # Phase 3 API Configuration (NLP & Sentiment)
-    REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID', None)
-    REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET', None)
-    REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'CryptoIntelDashboard/1.0')
-    
-    NEWSAPI_KEY = os.getenv('NEWSAPI_KEY', None)
-    TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN', None)
-    
+    REDDIT_CLIENT_ID: Optional[str] = os.getenv('REDDIT_CLIENT_ID', None)
+    REDDIT_CLIENT_SECRET: Optional[str] = os.getenv('REDDIT_CLIENT_SECRET', None)
+    REDDIT_USER_AGENT: str = os.getenv('REDDIT_USER_AGENT', 'CryptoIntelDashboard/1.0')
+
+    NEWSAPI_KEY: Optional[str] = os.getenv('NEWSAPI_KEY', None)
+    TWITTER_BEARER_TOKEN: Optional[str] = os.getenv('TWITTER_BEARER_TOKEN', None)
+
+    # Financial sentiment model (distilled by default: ~40% fewer layers
+    # than ProsusAI/finbert at near-equal accuracy)
+    FINBERT_MODEL: str = os.getenv(
+        'FINBERT_MODEL',
+        'mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis'
+    )
+    # 'torch' (default) or 'onnx' for CPU inference via onnxruntime
+    FINBERT_BACKEND: str = os.getenv('FINBERT_BACKEND', 'torch').lower()
+    # Dynamic INT8 quantization of Linear layers on the CPU torch path
+    FINBERT_QUANTIZE: bool = os.getenv('FINBERT_QUANTIZE', 'true').lower() == 'true'
+    # Trace/freeze the model with TorchScript to drop per-op Python dispatch
+    FINBERT_JIT: bool = os.getenv('FINBERT_JIT', 'false').lower() == 'true'
+    # Token cap per text; headlines rarely exceed ~80 tokens and attention
+    # cost grows quadratically with length
+    FINBERT_MAX_LEN: int = int(os.getenv('FINBERT_MAX_LEN', '128'))
+
     # Phase 3 Feature Flags
-    ENABLE_SOCIAL_SENTIMENT = os.getenv('ENABLE_SOCIAL_SENTIMENT', 'false').lower() == 'true'
-    ENABLE_REDDIT_RSS = os.getenv('ENABLE_REDDIT_RSS', 'false').lower() == 'true'  # Use RSS when API unavailable
-    ENABLE_TWITTER_SENTIMENT = os.getenv('ENABLE_TWITTER_SENTIMENT', 'false').lower() == 'true'
-    ENABLE_NEWS_SENTIMENT = os.getenv('ENABLE_NEWS_SENTIMENT', 'false').lower() == 'true'
-    ENABLE_SEARCH_TRENDS = os.getenv('ENABLE_SEARCH_TRENDS', 'false').lower() == 'true'
-    
+    ENABLE_SOCIAL_SENTIMENT: bool = os.getenv('ENABLE_SOCIAL_SENTIMENT', 'false').lower() == 'true'
+    ENABLE_REDDIT_RSS: bool = os.getenv('ENABLE_REDDIT_RSS', 'false').lower() == 'true'  # Use RSS when API unavailable
+    ENABLE_TWITTER_SENTIMENT: bool = os.getenv('ENABLE_TWITTER_SENTIMENT', 'false').lower() == 'true'
+    ENABLE_NEWS_SENTIMENT: bool = os.getenv('ENABLE_NEWS_SENTIMENT', 'false').lower() == 'true'
+    ENABLE_SEARCH_TRENDS: bool = os.getenv('ENABLE_SEARCH_TRENDS', 'false').lower() == 'true'
+
     # Phase 3 Configuration
-    CRYPTO_SUBREDDITS = ['CryptoCurrency', 'Bitcoin', 'ethereum']
-    SEARCH_KEYWORDS = ['bitcoin', 'ethereum', 'cryptocurrency']
-    
-    @classmethod
-    def validate(cls) -> bool:
-        """Validate configuration"""
-        # Ensure required directories exist
-        Path(cls.DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-        Path(cls.LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
-        
-        if cls.ENABLE_CSV_BACKUP:
-            Path(cls.CSV_BACKUP_PATH).mkdir(parents=True, exist_ok=True)
-        
-        return True
-    
-    @classmethod
-    def display(cls) -> dict:
-        """Return configuration as dictionary (excluding sensitive data)"""
+    CRYPTO_SUBREDDITS: List[str] = field(default_factory=lambda: ['CryptoCurrency', 'Bitcoin', 'ethereum'])
+    SEARCH_KEYWORDS: List[str] = field(default_factory=lambda: ['bitcoin', 'ethereum', 'cryptocurrency'])
+
+    def validate(self) -> bool:
+        """Validate configuration (directory creation memoized per process)"""
+        return _ensure_directories(
+            self.DB_PATH, self.LOG_PATH,
+            self.ENABLE_CSV_BACKUP, self.CSV_BACKUP_PATH
+        )
+
+    def display(self) -> dict:
+        """Return configuration as dictionary (excluding sensitive data)
+
+        The dict is built once per process and copied on each call.
+        """
+        global _DISPLAY
+        if _DISPLAY is None:
+            _DISPLAY = self._build_display()
+        return dict(_DISPLAY)
+
+    def _build_display(self) -> dict:
         return {
-            'DB_PATH': cls.DB_PATH,
-            'RATE_LIMIT_DELAY': cls.RATE_LIMIT_DELAY,
-            'DATA_RETENTION_DAYS': cls.DATA_RETENTION_DAYS,
-            'LOG_LEVEL': cls.LOG_LEVEL,
-            'ENABLE_CSV_BACKUP': cls.ENABLE_CSV_BACKUP,
-            'TRACKED_ASSETS': cls.TRACKED_ASSETS,
-            'HAS_COINGECKO_API_KEY': cls.COINGECKO_API_KEY is not None,
-            'HAS_SOSOVALUE_API_KEY': cls.SOSOVALUE_API_KEY is not None,
-            'ENABLE_MARKET_METRICS': cls.ENABLE_MARKET_METRICS,
-            'ENABLE_DERIVATIVES_DATA': cls.ENABLE_DERIVATIVES_DATA,
-            'BINANCE_FUTURES_BASE_URL': cls.BINANCE_FUTURES_BASE_URL,
-            'HAS_REDDIT_CREDENTIALS': cls.REDDIT_CLIENT_ID is not None and cls.REDDIT_CLIENT_SECRET is not None,
-            'HAS_NEWSAPI_KEY': cls.NEWSAPI_KEY is not None,
-            'HAS_TWITTER_TOKEN': cls.TWITTER_BEARER_TOKEN is not None,
-            'ENABLE_SOCIAL_SENTIMENT': cls.ENABLE_SOCIAL_SENTIMENT,
-            'ENABLE_REDDIT_RSS': cls.ENABLE_REDDIT_RSS,
-            'ENABLE_TWITTER_SENTIMENT': cls.ENABLE_TWITTER_SENTIMENT,
-            'ENABLE_NEWS_SENTIMENT': cls.ENABLE_NEWS_SENTIMENT,
-            'ENABLE_SEARCH_TRENDS': cls.ENABLE_SEARCH_TRENDS
+            'DB_PATH': self.DB_PATH,
+            'RATE_LIMIT_DELAY': self.RATE_LIMIT_DELAY,
+            'DATA_RETENTION_DAYS': self.DATA_RETENTION_DAYS,
+            'LOG_LEVEL': self.LOG_LEVEL,
+            'ENABLE_CSV_BACKUP': self.ENABLE_CSV_BACKUP,
+            'TRACKED_ASSETS': self.TRACKED_ASSETS,
+            'HAS_COINGECKO_API_KEY': self.COINGECKO_API_KEY is not None,
+            'HAS_SOSOVALUE_API_KEY': self.SOSOVALUE_API_KEY is not None,
+            'ENABLE_MARKET_METRICS': self.ENABLE_MARKET_METRICS,
+            'ENABLE_DERIVATIVES_DATA': self.ENABLE_DERIVATIVES_DATA,
+            'BINANCE_FUTURES_BASE_URL': self.BINANCE_FUTURES_BASE_URL,
+            'HAS_REDDIT_CREDENTIALS': self.REDDIT_CLIENT_ID is not None and self.REDDIT_CLIENT_SECRET is not None,
+            'HAS_NEWSAPI_KEY': self.NEWSAPI_KEY is not None,
+            'HAS_TWITTER_TOKEN': self.TWITTER_BEARER_TOKEN is not None,
+            'ENABLE_SOCIAL_SENTIMENT': self.ENABLE_SOCIAL_SENTIMENT,
+            'ENABLE_REDDIT_RSS': self.ENABLE_REDDIT_RSS,
+            'ENABLE_TWITTER_SENTIMENT': self.ENABLE_TWITTER_SENTIMENT,
+            'ENABLE_NEWS_SENTIMENT': self.ENABLE_NEWS_SENTIMENT,
+            'ENABLE_SEARCH_TRENDS': self.ENABLE_SEARCH_TRENDS
         }
 
+
+@functools.cache
+def _ensure_directories(
+    db_path: str,
+    log_path: str,
+    csv_backup_enabled: bool,
+    csv_backup_path: str
+) -> bool:
+    """Create required directories at most once per process
+
+    Long-running workers call Config.validate() defensively from several
+    subsystems; memoizing skips the repeated mkdir/stat syscalls.
+    """
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+
+    if csv_backup_enabled:
+        Path(csv_backup_path).mkdir(parents=True, exist_ok=True)
+
+    return True
+
+
+# Built lazily on first display() call, then reused
+_DISPLAY: Optional[dict] = None
+
+# Singleton instance; attribute reads resolve through __slots__
+CONFIG = _Config()
+
+# Backwards-compatible name for existing call sites/scripts
+Config = CONFIG
@@ -1,6 +1,5 @@
 """Time and timezone utilities"""
 from datetime import datetime, timezone
-import pytz
 
 
 def get_utc_now() -> datetime:
@@ -11,16 +10,34 @@ def get_utc_now() -> datetime:
 def timestamp_to_utc(ts_ms: int) -> datetime:
     """
     Convert millisecond timestamp to UTC datetime
-    
+
     Args:
         ts_ms: Timestamp in milliseconds
-    
+
     Returns:
         UTC datetime object
     """
     return datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
 
 
+def timestamps_to_utc(ts_ms):
+    """
+    Convert an array of millisecond timestamps to UTC datetimes
+
+    One vectorized int64 conversion instead of a Python datetime
+    construction per element — use this when converting whole candle
+    batches.
+
+    Args:
+        ts_ms: Array-like of timestamps in milliseconds
+
+    Returns:
+        pandas DatetimeIndex (tz-aware, UTC)
+    """
+    import pandas as pd
+    return pd.to_datetime(ts_ms, unit='ms', utc=True)
+
+
 def get_date_string(dt: datetime = None) -> str:
     """
     Get date string in YYYY-MM-DD format
@@ -36,20 +53,35 @@ def get_date_string(dt: datetime = None) -> str:
     return dt.strftime('%Y-%m-%d')
 
 
+# Session per UTC hour, precomputed so classification is one tuple load
+_SESSIONS = ("ASIA",) * 8 + ("EUROPE",) * 8 + ("US",) * 8
+
+
 def classify_trading_session(hour_utc: int) -> str:
     """
     Classify trading session based on UTC hour
-    
+
     Args:
         hour_utc: Hour in UTC (0-23)
-    
+
     Returns:
         Session name: ASIA, EUROPE, or US
     """
-    if 0 <= hour_utc < 8:
-        return "ASIA"
-    elif 8 <= hour_utc < 16:
-        return "EUROPE"
-    else:
-        return "US"
+    if not 0 <= hour_utc < 24:
+        raise ValueError(f"hour_utc must be in 0-23, got {hour_utc}")
+    return _SESSIONS[hour_utc]
+
+
+def classify_trading_sessions(hours_utc):
+    """
+    Classify trading sessions for an array of UTC hours
+
+    Args:
+        hours_utc: Array-like of hours in UTC (0-23)
+
+    Returns:
+        NumPy array of session names
+    """
+    import numpy as np
+    return np.take(np.array(_SESSIONS), hours_utc)
 
@@ -6,6 +6,7 @@ This script performs basic validation without making API calls.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 def test_imports():
@@ -139,13 +140,21 @@ def main():
         ("Time Utilities", test_time_utils),
     ]
     
-    results = []
-    for name, test_func in tests:
-        try:
-            results.append(test_func())
-        except Exception as e:
-            print(f"❌ {name} test crashed: {e}")
-            results.append(False)
+    # The tests are independent (separate temp DBs, no shared state), so
+    # run them concurrently; results are collected back into input order
+    results = [False] * len(tests)
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        future_to_index = {
+            executor.submit(test_func): i
+            for i, (_, test_func) in enumerate(tests)
+        }
+        for future in as_completed(future_to_index):
+            i = future_to_index[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                print(f"❌ {tests[i][0]} test crashed: {e}")
+                results[i] = False
     
     print("\n" + "=" * 70)
     print("TEST SUMMARY")
@@ -10,63 +10,72 @@ from src.storage.database import MarketDatabase
 class TestPhase3Schema(unittest.TestCase):
     """Test Phase 3 schema creation and operations"""
     
-    def setUp(self):
-        """Create temporary database for testing"""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
-        
-        self.schema = DatabaseSchema(self.db_path)
-        self.schema.initialize_database()
-        self.db = MarketDatabase(self.db_path)
-    
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary database shared by all tests in the class"""
+        # Back the file with tmpfs when available (override with
+        # CRYPTO_TRACKER_TEST_TMP) so the on-disk code path stays exercised
+        # without paying for real disk I/O
+        tmp_root = os.environ.get(
+            'CRYPTO_TRACKER_TEST_TMP',
+            '/dev/shm' if os.path.isdir('/dev/shm') else None
+        )
+        temp_db = tempfile.NamedTemporaryFile(
+            delete=False, suffix='.db', dir=tmp_root
+        )
+        cls.db_path = temp_db.name
+        temp_db.close()
+
+        cls.schema = DatabaseSchema(cls.db_path)
+        cls.schema.initialize_database()
+        cls.db = MarketDatabase(cls.db_path)
+
+        # Single verification connection; durability is irrelevant for a
+        # throwaway test DB, so skip fsyncs and keep the journal in memory
+        cls.conn = sqlite3.connect(cls.db_path)
+        cls.conn.execute("PRAGMA synchronous=OFF")
+        cls.conn.execute("PRAGMA journal_mode=MEMORY")
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary database"""
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+        cls.conn.close()
+        if os.path.exists(cls.db_path):
+            os.unlink(cls.db_path)
     
     def test_schema_version(self):
-        """Test schema version is updated to 4"""
-        self.assertEqual(self.schema.SCHEMA_VERSION, 4)
+        """Test schema version is updated to 6"""
+        self.assertEqual(self.schema.SCHEMA_VERSION, 6)
     
     def test_social_sentiment_table_exists(self):
         """Test social_sentiment_daily table creation"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cursor = self.conn.cursor()
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='social_sentiment_daily'"
         )
         result = cursor.fetchone()
         
         self.assertIsNotNone(result)
-        conn.close()
     
     def test_news_sentiment_table_exists(self):
         """Test news_sentiment_daily table creation"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cursor = self.conn.cursor()
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='news_sentiment_daily'"
         )
         result = cursor.fetchone()
         
         self.assertIsNotNone(result)
-        conn.close()
     
     def test_search_interest_table_exists(self):
         """Test search_interest_daily table creation"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cursor = self.conn.cursor()
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='search_interest_daily'"
         )
         result = cursor.fetchone()
         
         self.assertIsNotNone(result)
-        conn.close()
     
     def test_insert_social_sentiment(self):
         """Test inserting social sentiment data"""
@@ -88,13 +97,14 @@ class TestPhase3Schema(unittest.TestCase):
         count = self.db.insert_social_sentiment(records)
         self.assertEqual(count, 1)
         
-        # Verify data
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM social_sentiment_daily")
+        # Verify data (scoped to this test's platform: the DB is shared)
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM social_sentiment_daily WHERE platform = ?",
+            ('reddit_cryptocurrency',)
+        )
         result = cursor.fetchone()[0]
         self.assertEqual(result, 1)
-        conn.close()
     
     def test_insert_news_sentiment(self):
         """Test inserting news sentiment data"""
@@ -116,12 +126,10 @@ class TestPhase3Schema(unittest.TestCase):
         self.assertEqual(count, 1)
         
         # Verify data
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM news_sentiment_daily")
         result = cursor.fetchone()[0]
         self.assertEqual(result, 1)
-        conn.close()
     
     def test_insert_search_interest(self):
         """Test inserting search interest data"""
@@ -140,12 +148,10 @@ class TestPhase3Schema(unittest.TestCase):
         self.assertEqual(count, 1)
         
         # Verify data
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM search_interest_daily")
         result = cursor.fetchone()[0]
         self.assertEqual(result, 1)
-        conn.close()
     
     def test_idempotent_inserts(self):
         """Test that duplicate inserts are idempotent"""
@@ -163,19 +169,96 @@ class TestPhase3Schema(unittest.TestCase):
         count1 = self.db.insert_social_sentiment(records)
         count2 = self.db.insert_social_sentiment(records)
         
-        # Should still have only 1 record
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM social_sentiment_daily")
+        # Should still have only 1 record for this platform
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM social_sentiment_daily WHERE platform = ?",
+            ('reddit_bitcoin',)
+        )
         result = cursor.fetchone()[0]
         self.assertEqual(result, 1)
-        conn.close()
     
+    def test_version_upgrade_reapplies_ddl(self):
+        """Test that an older recorded version triggers a schema upgrade"""
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        db_path = temp_db.name
+        temp_db.close()
+
+        try:
+            DatabaseSchema(db_path).initialize_database()
+
+            # Rewind to version 4 and drop a version-6 index, mimicking a
+            # database created before this schema revision
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("DROP INDEX idx_news_raw_pubdate")
+                conn.execute("DELETE FROM schema_version")
+                conn.execute("INSERT INTO schema_version (version) VALUES (4)")
+                conn.commit()
+
+            # Opening the database must re-apply the DDL and record the
+            # current version
+            MarketDatabase(db_path).close()
+
+            schema = DatabaseSchema(db_path)
+            self.assertEqual(
+                schema.get_current_version(), DatabaseSchema.SCHEMA_VERSION
+            )
+            with sqlite3.connect(db_path) as conn:
+                cursor = conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='index' AND name='idx_news_raw_pubdate'"
+                )
+                self.assertIsNotNone(cursor.fetchone())
+        finally:
+            os.unlink(db_path)
+
+    def test_version_upgrade_rescales_raw_sentiment(self):
+        """Test that pre-v6 float sentiment values are rescaled on upgrade"""
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        db_path = temp_db.name
+        temp_db.close()
+
+        try:
+            DatabaseSchema(db_path).initialize_database()
+
+            # Rewind to version 4 and plant a raw article with the plain
+            # float scores older versions wrote
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    "INSERT INTO news_articles_raw "
+                    "(article_url, title, published_at, sentiment_compound, "
+                    " sentiment_label, sentiment_confidence) "
+                    "VALUES ('https://news.com/old', 'Old', '2025-01-01', "
+                    "        0.6, 'positive', 0.9)"
+                )
+                conn.execute("DELETE FROM schema_version")
+                conn.execute("INSERT INTO schema_version (version) VALUES (4)")
+                conn.commit()
+
+            # Opening the database must rescale the stored floats to the
+            # fixed-point representation the readers de-scale from
+            db = MarketDatabase(db_path)
+            row = db.scalar_row(
+                "SELECT sentiment_compound, sentiment_confidence "
+                "FROM news_articles_raw WHERE article_url = ?",
+                ('https://news.com/old',)
+            )
+            self.assertEqual(row, (6000, 9000))
+
+            # A second open must not rescale again
+            db.close()
+            MarketDatabase(db_path).close()
+            with sqlite3.connect(db_path) as conn:
+                cursor = conn.execute(
+                    "SELECT sentiment_compound FROM news_articles_raw"
+                )
+                self.assertEqual(cursor.fetchone()[0], 6000)
+        finally:
+            os.unlink(db_path)
+
     def test_phase3_indexes_created(self):
         """Test that Phase 3 indexes are created"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cursor = self.conn.cursor()
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
         )
@@ -187,8 +270,6 @@ class TestPhase3Schema(unittest.TestCase):
         self.assertIn('idx_news_date', indexes)
         self.assertIn('idx_search_date', indexes)
         self.assertIn('idx_search_keyword', indexes)
-        
-        conn.close()
 
 
 if __name__ == '__main__':
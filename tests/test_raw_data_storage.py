@@ -1,39 +1,143 @@
 """Tests for Phase 3 raw data storage and aggregation"""
 import unittest
 import sqlite3
-import tempfile
-import os
 from datetime import datetime, timedelta
-from pathlib import Path
 
-from src.storage.database import MarketDatabase
+from src.storage.database import MarketDatabase, SocialPostRaw
 from src.storage.schema import DatabaseSchema
 
 
 class TestRawDataStorage(unittest.TestCase):
     """Test raw data storage and aggregation for Phase 3"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the schema once in an in-memory template database
+
+        The open connection keeps the shared-cache database alive for the
+        whole class; per-test databases are cloned from it via backup(),
+        so no test pays for DDL or disk I/O.
+        """
+        cls.template_uri = 'file:raw_storage_template?mode=memory&cache=shared'
+        cls.template_conn = sqlite3.connect(cls.template_uri, uri=True)
+        DatabaseSchema(cls.template_uri).initialize_database()
+
+        # Second template, pre-populated with the canonical fixture rows
+        # used by the aggregation tests, so those rows are built and
+        # inserted exactly once for the whole class
+        cls.fixture_time = datetime.now()
+        cls.fixture_date = cls.fixture_time.strftime('%Y-%m-%d')
+        cls.data_uri = 'file:raw_storage_data?mode=memory&cache=shared'
+        cls.data_conn = sqlite3.connect(cls.data_uri, uri=True)
+        cls.template_conn.backup(cls.data_conn)
+
+        data_db = MarketDatabase(cls.data_uri)
+        data_db.insert_social_posts_raw(cls._social_posts_fixture())
+        data_db.insert_news_articles_raw(cls._news_articles_fixture())
+        data_db.insert_search_trends_raw(cls._search_trends_fixture())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the template databases"""
+        cls.data_conn.close()
+        cls.template_conn.close()
+
+    @classmethod
+    def _social_posts_fixture(cls):
+        """Ten reddit posts: even indices positive, odd negative"""
+        return [
+            {
+                'id': f'post{i}',
+                'platform': 'reddit_cryptocurrency',
+                'subreddit': 'CryptoCurrency',
+                'title': f'Post {i}',
+                'text': 'Test content',
+                'author': 'testuser',
+                'created_utc': cls.fixture_time,
+                'score': 100,
+                'upvote_ratio': 0.9,
+                'num_comments': 10,
+                'url': f'https://reddit.com/post{i}',
+                'sentiment_compound': 0.5 if i % 2 == 0 else -0.3,
+                'sentiment_pos': 0.6 if i % 2 == 0 else 0.2,
+                'sentiment_neg': 0.2 if i % 2 == 0 else 0.6,
+                'sentiment_neu': 0.2,
+                'sentiment_label': 'POSITIVE' if i % 2 == 0 else 'NEGATIVE'
+            }
+            for i in range(10)
+        ]
+
+    @classmethod
+    def _news_articles_fixture(cls):
+        """Ten articles: seven positive, three negative"""
+        return [
+            {
+                'url': f'https://news.com/article{i}',
+                'title': f'Article {i}',
+                'description': 'Test content',
+                'source': 'TestNews',
+                'author': 'Author',
+                'published_at': cls.fixture_time,
+                'sentiment_compound': 0.6 if i < 7 else -0.4,
+                'sentiment_label': 'positive' if i < 7 else 'negative',
+                'sentiment_confidence': 0.9,
+                'positive_prob': 0.7 if i < 7 else 0.2,
+                'negative_prob': 0.2 if i < 7 else 0.7,
+                'neutral_prob': 0.1
+            }
+            for i in range(10)
+        ]
+
+    @classmethod
+    def _search_trends_fixture(cls):
+        """Bitcoin interest for today (90) and yesterday (80)"""
+        return [
+            {
+                'ts_utc': cls.fixture_time,
+                'keyword': 'bitcoin',
+                'interest_score': 90.0,
+                'geo': '',
+                'timeframe': 'now 7-d'
+            },
+            {
+                'ts_utc': cls.fixture_time - timedelta(days=1),
+                'keyword': 'bitcoin',
+                'interest_score': 80.0,
+                'geo': '',
+                'timeframe': 'now 7-d'
+            }
+        ]
+
+    def _load_fixture_data(self):
+        """Overwrite the per-test database with the populated template"""
+        self.data_conn.backup(self._anchor)
+
     def setUp(self):
-        """Set up test database"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, 'test_raw_data.db')
-        self.db = MarketDatabase(self.db_path)
-    
+        """Clone the schema template into a fresh in-memory database"""
+        self.db_path = f'file:raw_{self._testMethodName}?mode=memory&cache=shared'
+        self._anchor = sqlite3.connect(self.db_path, uri=True)
+        self.template_conn.backup(self._anchor)
+        # Unsafe-but-fast profile: durability is irrelevant for test data
+        self.db = MarketDatabase(self.db_path, pragmas=[
+            'journal_mode=MEMORY',
+            'synchronous=OFF',
+            'temp_store=MEMORY',
+            'cache_size=-20000',
+        ])
+
     def tearDown(self):
-        """Clean up test database"""
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        """Drop the per-test database by closing its last connections"""
+        self.db.close()
+        self._anchor.close()
     
     def test_schema_version_updated(self):
-        """Test that schema version is updated to 4"""
+        """Test that schema version is updated to 6"""
         schema = DatabaseSchema(self.db_path)
-        self.assertEqual(schema.SCHEMA_VERSION, 4)
+        self.assertEqual(schema.SCHEMA_VERSION, 6)
     
     def test_raw_tables_exist(self):
         """Test that raw data tables are created"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._anchor.cursor()
         
         # Check for raw data tables
         cursor.execute(
@@ -45,11 +149,10 @@ class TestRawDataStorage(unittest.TestCase):
         self.assertIn('social_posts_raw', tables)
         self.assertIn('news_articles_raw', tables)
         self.assertIn('search_trends_raw', tables)
-        
-        conn.close()
     
     def test_insert_social_posts_raw(self):
         """Test inserting raw social posts"""
+        now = datetime.now()
         test_posts = [
             {
                 'id': 'post123',
@@ -58,7 +161,7 @@ class TestRawDataStorage(unittest.TestCase):
                 'title': 'Bitcoin hits new high',
                 'text': 'This is amazing news for crypto!',
                 'author': 'testuser',
-                'created_utc': datetime.now(),
+                'created_utc': now,
                 'score': 100,
                 'upvote_ratio': 0.95,
                 'num_comments': 50,
@@ -76,7 +179,7 @@ class TestRawDataStorage(unittest.TestCase):
                 'title': 'Market crash incoming',
                 'text': 'This looks bad for crypto',
                 'author': 'testuser2',
-                'created_utc': datetime.now(),
+                'created_utc': now,
                 'score': 50,
                 'upvote_ratio': 0.75,
                 'num_comments': 25,
@@ -93,15 +196,11 @@ class TestRawDataStorage(unittest.TestCase):
         self.assertEqual(count, 2)
         
         # Verify data was inserted
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM social_posts_raw")
-        result = cursor.fetchone()[0]
-        self.assertEqual(result, 2)
-        conn.close()
+        self.assertEqual(self.db.count('social_posts_raw'), 2)
     
     def test_insert_news_articles_raw(self):
         """Test inserting raw news articles"""
+        now = datetime.now()
         test_articles = [
             {
                 'url': 'https://news.com/article1',
@@ -109,7 +208,7 @@ class TestRawDataStorage(unittest.TestCase):
                 'description': 'Bitcoin reaches all-time high',
                 'source': 'CryptoNews',
                 'author': 'John Doe',
-                'published_at': datetime.now(),
+                'published_at': now,
                 'sentiment_compound': 0.7,
                 'sentiment_label': 'positive',
                 'sentiment_confidence': 0.9,
@@ -123,7 +222,7 @@ class TestRawDataStorage(unittest.TestCase):
                 'description': 'Network congestion continues',
                 'source': 'TechNews',
                 'author': 'Jane Smith',
-                'published_at': datetime.now(),
+                'published_at': now,
                 'sentiment_compound': -0.4,
                 'sentiment_label': 'negative',
                 'sentiment_confidence': 0.85,
@@ -137,25 +236,21 @@ class TestRawDataStorage(unittest.TestCase):
         self.assertEqual(count, 2)
         
         # Verify data was inserted
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM news_articles_raw")
-        result = cursor.fetchone()[0]
-        self.assertEqual(result, 2)
-        conn.close()
+        self.assertEqual(self.db.count('news_articles_raw'), 2)
     
     def test_insert_search_trends_raw(self):
         """Test inserting raw search trends"""
+        now = datetime.now()
         test_trends = [
             {
-                'ts_utc': datetime.now(),
+                'ts_utc': now,
                 'keyword': 'bitcoin',
                 'interest_score': 85.0,
                 'geo': '',
                 'timeframe': 'now 7-d'
             },
             {
-                'ts_utc': datetime.now(),
+                'ts_utc': now,
                 'keyword': 'ethereum',
                 'interest_score': 72.0,
                 'geo': '',
@@ -167,153 +262,141 @@ class TestRawDataStorage(unittest.TestCase):
         self.assertEqual(count, 2)
         
         # Verify data was inserted
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM search_trends_raw")
-        result = cursor.fetchone()[0]
-        self.assertEqual(result, 2)
-        conn.close()
+        self.assertEqual(self.db.count('search_trends_raw'), 2)
     
+    def test_insert_social_posts_raw_tuples(self):
+        """Test the positional tuple fast path for raw social posts"""
+        now = datetime.now()
+        rows = [
+            SocialPostRaw(
+                post_id=f'tuple_post{i}',
+                platform='reddit',
+                subreddit='CryptoCurrency',
+                title=f'Post {i}',
+                text='Test content',
+                author='testuser',
+                created_utc=now,
+                score=10,
+                upvote_ratio=0.9,
+                num_comments=5,
+                url=f'https://reddit.com/tuple_post{i}',
+                sentiment_compound=0.5,
+                sentiment_pos=0.6,
+                sentiment_neg=0.2,
+                sentiment_neu=0.2,
+                sentiment_label='POSITIVE'
+            )
+            for i in range(3)
+        ]
+
+        count = self.db.insert_social_posts_raw_tuples(rows)
+        self.assertEqual(count, 3)
+
+        # Verify data was inserted
+        self.assertEqual(self.db.count('social_posts_raw'), 3)
+
     def test_compute_social_sentiment_from_raw(self):
         """Test computing aggregated social sentiment from raw posts"""
-        today = datetime.now()
-        test_date = today.strftime('%Y-%m-%d')
-        
-        # Insert raw posts
-        test_posts = [
-            {
-                'id': f'post{i}',
-                'platform': 'reddit_cryptocurrency',
-                'subreddit': 'CryptoCurrency',
-                'title': f'Post {i}',
-                'text': 'Test content',
-                'author': 'testuser',
-                'created_utc': today,
-                'score': 100,
-                'upvote_ratio': 0.9,
-                'num_comments': 10,
-                'url': f'https://reddit.com/post{i}',
-                'sentiment_compound': 0.5 if i % 2 == 0 else -0.3,
-                'sentiment_pos': 0.6 if i % 2 == 0 else 0.2,
-                'sentiment_neg': 0.2 if i % 2 == 0 else 0.6,
-                'sentiment_neu': 0.2,
-                'sentiment_label': 'POSITIVE' if i % 2 == 0 else 'NEGATIVE'
-            }
-            for i in range(10)
-        ]
-        
-        self.db.insert_social_posts_raw(test_posts)
-        
+        test_date = self.fixture_date
+        self._load_fixture_data()
+
         # Compute aggregated sentiment
         self.db.compute_social_sentiment_from_raw(test_date)
         
-        # Verify aggregated data was created
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
+        # Verify all aggregates in one query
+        row = self.db.scalar_row(
             "SELECT mentions_count, positive_mentions, negative_mentions FROM social_sentiment_daily WHERE as_of_date = ?",
             (test_date,)
         )
-        result = cursor.fetchone()
-        
-        self.assertIsNotNone(result)
-        self.assertEqual(result[0], 10)  # mentions_count
-        self.assertEqual(result[1], 5)   # positive_mentions
-        self.assertEqual(result[2], 5)   # negative_mentions
-        
-        conn.close()
+
+        self.assertEqual(row, (10, 5, 5))
     
     def test_compute_news_sentiment_from_raw(self):
         """Test computing aggregated news sentiment from raw articles"""
-        today = datetime.now()
-        test_date = today.strftime('%Y-%m-%d')
+        test_date = self.fixture_date
+        self._load_fixture_data()
+
+        # Compute aggregated sentiment
+        self.db.compute_news_sentiment_from_raw(test_date)
         
-        # Insert raw articles
-        test_articles = [
+        # Verify all aggregates in one query (7 of 10 positive, 3 negative)
+        row = self.db.scalar_row(
+            "SELECT article_count, positive_pct, negative_pct FROM news_sentiment_daily WHERE as_of_date = ?",
+            (test_date,)
+        )
+
+        self.assertEqual(row, (10, 70.0, 30.0))
+
+    def test_compute_news_sentiment_range(self):
+        """Test backfilling news sentiment over a multi-day range"""
+        day_two = self.fixture_time
+        day_one = day_two - timedelta(days=1)
+
+        self.db.insert_news_articles_raw([
             {
-                'url': f'https://news.com/article{i}',
-                'title': f'Article {i}',
+                'url': f'https://news.com/range{i}',
+                'title': f'Range article {i}',
                 'description': 'Test content',
                 'source': 'TestNews',
                 'author': 'Author',
-                'published_at': today,
-                'sentiment_compound': 0.6 if i < 7 else -0.4,
-                'sentiment_label': 'positive' if i < 7 else 'negative',
+                'published_at': day_one if i < 2 else day_two,
+                # Day one: one positive, one negative; day two: two positive
+                'sentiment_compound': -0.5 if i == 1 else (0.5 if i == 0 else 0.6),
+                'sentiment_label': 'negative' if i == 1 else 'positive',
                 'sentiment_confidence': 0.9,
-                'positive_prob': 0.7 if i < 7 else 0.2,
-                'negative_prob': 0.2 if i < 7 else 0.7,
+                'positive_prob': 0.1 if i == 1 else 0.8,
+                'negative_prob': 0.8 if i == 1 else 0.1,
                 'neutral_prob': 0.1
             }
-            for i in range(10)
-        ]
-        
-        self.db.insert_news_articles_raw(test_articles)
-        
-        # Compute aggregated sentiment
-        self.db.compute_news_sentiment_from_raw(test_date)
-        
-        # Verify aggregated data was created
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT article_count, positive_pct, negative_pct FROM news_sentiment_daily WHERE as_of_date = ?",
-            (test_date,)
+            for i in range(4)
+        ])
+
+        start_date = day_one.strftime('%Y-%m-%d')
+        end_date = day_two.strftime('%Y-%m-%d')
+        self.db.compute_news_sentiment_range(start_date, end_date)
+
+        row_sql = (
+            "SELECT article_count, avg_sentiment, positive_pct, negative_pct "
+            "FROM news_sentiment_daily WHERE as_of_date = ?"
         )
-        result = cursor.fetchone()
-        
-        self.assertIsNotNone(result)
-        self.assertEqual(result[0], 10)  # article_count
-        self.assertEqual(result[1], 70.0)  # positive_pct (7 out of 10)
-        self.assertEqual(result[2], 30.0)  # negative_pct (3 out of 10)
-        
-        conn.close()
-    
+        self.assertEqual(
+            self.db.scalar_row(row_sql, (start_date,)), (2, 0.0, 50.0, 50.0)
+        )
+        self.assertEqual(
+            self.db.scalar_row(row_sql, (end_date,)), (2, 0.6, 100.0, 0.0)
+        )
+
+        # Re-running the backfill must recreate its TEMP table cleanly on
+        # the shared connection and replace, not duplicate, the daily rows
+        self.db.compute_news_sentiment_range(start_date, end_date)
+        self.assertEqual(
+            self.db.count('news_sentiment_daily',
+                          'as_of_date BETWEEN ? AND ?',
+                          (start_date, end_date)),
+            2
+        )
+
     def test_compute_search_interest_from_raw(self):
         """Test computing aggregated search interest from raw trends"""
-        today = datetime.now()
-        yesterday = today - timedelta(days=1)
-        test_date = today.strftime('%Y-%m-%d')
-        
-        # Insert raw trends for today and yesterday
-        test_trends = [
-            {
-                'ts_utc': today,
-                'keyword': 'bitcoin',
-                'interest_score': 90.0,
-                'geo': '',
-                'timeframe': 'now 7-d'
-            },
-            {
-                'ts_utc': yesterday,
-                'keyword': 'bitcoin',
-                'interest_score': 80.0,
-                'geo': '',
-                'timeframe': 'now 7-d'
-            }
-        ]
-        
-        self.db.insert_search_trends_raw(test_trends)
-        
+        test_date = self.fixture_date
+        self._load_fixture_data()
+
         # Compute aggregated interest
         self.db.compute_search_interest_from_raw(test_date)
         
-        # Verify aggregated data was created
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
+        # Verify all aggregates in one query
+        row = self.db.scalar_row(
             "SELECT interest_score, interest_change_pct FROM search_interest_daily WHERE as_of_date = ? AND keyword = ?",
             (test_date, 'bitcoin')
         )
-        result = cursor.fetchone()
-        
-        self.assertIsNotNone(result)
-        self.assertEqual(result[0], 90.0)  # interest_score
-        self.assertAlmostEqual(result[1], 12.5, places=1)  # interest_change_pct ((90-80)/80*100)
-        
-        conn.close()
+
+        self.assertIsNotNone(row)
+        self.assertEqual(row[0], 90)  # interest_score
+        self.assertAlmostEqual(row[1], 12.5, places=1)  # interest_change_pct ((90-80)/80*100)
     
     def test_idempotent_raw_inserts(self):
         """Test that raw data inserts are idempotent"""
+        now = datetime.now()
         test_post = {
             'id': 'unique_post',
             'platform': 'reddit',
@@ -321,7 +404,7 @@ class TestRawDataStorage(unittest.TestCase):
             'title': 'Test',
             'text': 'Content',
             'author': 'user',
-            'created_utc': datetime.now(),
+            'created_utc': now,
             'score': 10,
             'upvote_ratio': 0.8,
             'num_comments': 5,
@@ -338,12 +421,10 @@ class TestRawDataStorage(unittest.TestCase):
         self.db.insert_social_posts_raw([test_post])
         
         # Verify only one record exists
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM social_posts_raw WHERE post_id = ?", ('unique_post',))
-        result = cursor.fetchone()[0]
-        self.assertEqual(result, 1)
-        conn.close()
+        self.assertEqual(
+            self.db.count('social_posts_raw', 'post_id = ?', ('unique_post',)),
+            1
+        )
     
     def test_record_counts_include_raw_tables(self):
         """Test that get_record_counts includes raw data tables"""
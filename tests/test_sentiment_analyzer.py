@@ -2,10 +2,13 @@
 import unittest
 from src.utils.sentiment_analyzer import (
     analyze_vader_sentiment,
+    analyze_finbert_sentiment_batch,
     classify_sentiment,
+    classify_sentiment_array,
     aggregate_sentiment_scores,
     extract_keywords,
-    calculate_engagement_score
+    calculate_engagement_score,
+    calculate_engagement_scores
 )
 
 
@@ -61,6 +64,13 @@ class TestSentimentAnalyzer(unittest.TestCase):
         self.assertEqual(classify_sentiment(0.04), 'NEUTRAL')
         self.assertEqual(classify_sentiment(-0.04), 'NEUTRAL')
     
+    def test_classify_sentiment_array_matches_scalar(self):
+        """Test batch classification agrees with the scalar helper"""
+        scores = [-1.0, -0.5, -0.05, -0.049, 0.0, 0.049, 0.05, 0.5, 1.0]
+        batch = classify_sentiment_array(scores)
+
+        self.assertEqual(list(batch), [classify_sentiment(s) for s in scores])
+
     def test_aggregate_sentiment_scores(self):
         """Test sentiment score aggregation"""
         scores = [0.5, -0.3, 0.1, 0.8, -0.1]
@@ -129,6 +139,37 @@ class TestSentimentAnalyzer(unittest.TestCase):
         self.assertIsInstance(score, float)
         self.assertGreaterEqual(score, 0)
 
+    def test_calculate_engagement_scores_match_scalar(self):
+        """Test batch engagement scores agree with the scalar helper"""
+        rows = [
+            (100, 20, 5, 1000),
+            (10, 5, 2, 0),          # zero views
+            (0, 0, 0, 1),           # no engagement
+            (5000, 900, 300, 100)   # hits the 100 cap
+        ]
+        batch = calculate_engagement_scores(
+            [r[0] for r in rows],
+            [r[1] for r in rows],
+            [r[2] for r in rows],
+            [r[3] for r in rows]
+        )
+
+        for score, row in zip(batch, rows):
+            self.assertAlmostEqual(score, calculate_engagement_score(*row))
+
+    def test_finbert_batch_empty_input(self):
+        """Test batch FinBERT scoring with no texts"""
+        self.assertEqual(analyze_finbert_sentiment_batch([]), [])
+
+    def test_finbert_batch_blank_texts(self):
+        """Test that blank texts get neutral scores without a model load"""
+        results = analyze_finbert_sentiment_batch(['', '   '])
+
+        self.assertEqual(
+            results,
+            [{'label': 'neutral', 'score': 1.0, 'compound': 0.0}] * 2
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+"""Unit tests for time and timezone utilities"""
+import unittest
+from src.utils.time_utils import (
+    timestamp_to_utc,
+    timestamps_to_utc,
+    classify_trading_session,
+    classify_trading_sessions
+)
+
+
+class TestTimeUtils(unittest.TestCase):
+    """Test time and timezone utilities"""
+
+    def test_classify_trading_session_sessions(self):
+        """Test scalar session classification per region"""
+        self.assertEqual(classify_trading_session(2), 'ASIA')
+        self.assertEqual(classify_trading_session(10), 'EUROPE')
+        self.assertEqual(classify_trading_session(18), 'US')
+
+    def test_classify_trading_session_invalid_hour(self):
+        """Test scalar session classification rejects out-of-range hours"""
+        with self.assertRaises(ValueError):
+            classify_trading_session(24)
+
+    def test_classify_trading_sessions_matches_scalar(self):
+        """Test batch session classification agrees with the scalar helper"""
+        hours = list(range(24))
+        batch = classify_trading_sessions(hours)
+
+        self.assertEqual(
+            list(batch), [classify_trading_session(h) for h in hours]
+        )
+
+    def test_timestamps_to_utc_matches_scalar(self):
+        """Test batch timestamp conversion agrees with the scalar helper"""
+        ts_ms = [0, 1_700_000_000_000, 1_755_555_555_500]
+        batch = timestamps_to_utc(ts_ms)
+
+        self.assertEqual(str(batch.tz), 'UTC')
+        for converted, ts in zip(batch, ts_ms):
+            self.assertEqual(converted.to_pydatetime(), timestamp_to_utc(ts))
+
+
+if __name__ == '__main__':
+    unittest.main()